@@ -7,6 +7,7 @@ from uas_pipeline.extractors import (
     DEFAULT_STATE_ABBREV,
     extract_airport_code,
     extract_details,
+    extract_details_frame,
     extract_leo_agency,
     get_best_col,
     normalize_state,
@@ -30,6 +31,23 @@ class TestExtractors(unittest.TestCase):
         self.assertEqual(alt, "1500")
         self.assertEqual(evasive, "YES")
 
+    def test_extract_details_frame_matches_scalar(self):
+        texts = pd.Series([
+            "UAS RED DRONE ADVISED, C172, 1,500 FEET EVASIVE ACTION",
+            "CESSNA AT FL 250 NO EVASIVE ACTION",
+            None,
+        ])
+        frame = extract_details_frame(texts, 50000)
+        self.assertEqual(frame.loc[0, "Acft_Type"], "C172")
+        self.assertEqual(frame.loc[0, "UAS_Color"], "RED")
+        self.assertEqual(frame.loc[0, "Alt_Ft"], "1500")
+        self.assertEqual(frame.loc[0, "Evasive"], "YES")
+        self.assertEqual(frame.loc[1, "Acft_Type"], "CESSNA")
+        self.assertEqual(frame.loc[1, "Alt_Ft"], "25000")
+        self.assertEqual(frame.loc[1, "Evasive"], "NO")
+        self.assertEqual(frame.loc[2, "UAS_Color"], "UNKNOWN")
+        self.assertEqual(frame.loc[2, "Evasive"], "NO")
+
     def test_extract_leo_agency(self):
         text = "STATE POLICE NOTIFIED"
         self.assertEqual(extract_leo_agency(text, 50000), "STATE POLICE")
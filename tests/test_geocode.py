@@ -1,3 +1,5 @@
+import os
+import stat
 import tempfile
 import unittest
 from dataclasses import dataclass
@@ -5,6 +7,7 @@ from pathlib import Path
 
 from uas_pipeline.extractors import DEFAULT_STATE_ABBREV, normalize_state
 from uas_pipeline.geocode import (
+    SqliteCityCache,
     find_nearest_airport,
     load_cache_safely,
     save_cache_with_validation,
@@ -50,6 +53,39 @@ class TestGeocode(unittest.TestCase):
             loaded = load_cache_safely(cache_file)
             self.assertEqual(loaded, {})
 
+    def test_sqlite_cache_roundtrip_and_migration(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            json_file = Path(tmp) / "cache.json"
+            save_cache_with_validation(json_file, {"Seattle, WA": "SEA"})
+
+            cache = SqliteCityCache(Path(tmp) / "cache.db")
+            try:
+                cache.migrate_from_json(json_file)
+                self.assertIn("Seattle, WA", cache)
+                self.assertEqual(cache["Seattle, WA"], "SEA")
+
+                cache["Portland, OR"] = "PDX"
+                self.assertEqual(len(cache), 2)
+                self.assertEqual(cache.as_dict()["Portland, OR"], "PDX")
+                self.assertIsNone(cache.get("Boise, ID"))
+            finally:
+                cache.close()
+
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_sqlite_cache_secures_wal_sidecars(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_file = Path(tmp) / "cache.db"
+            cache = SqliteCityCache(db_file)
+            try:
+                cache["Seattle, WA"] = "SEA"
+                for suffix in ("", "-wal", "-shm"):
+                    sidecar = Path(str(db_file) + suffix)
+                    self.assertEqual(
+                        stat.S_IMODE(sidecar.stat().st_mode), 0o600, sidecar.name
+                    )
+            finally:
+                cache.close()
+
     def test_find_nearest_airport_returns_unknown_for_missing(self):
         result = find_nearest_airport(
             None,
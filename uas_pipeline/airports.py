@@ -1,7 +1,21 @@
 """Airport lookup data access."""
 from __future__ import annotations
 
+import json
+import logging
+from pathlib import Path
+
 import airportsdata
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 
 def load_airports():
@@ -15,3 +29,82 @@ def load_airports():
         if data.get('country') == 'US' and data.get('iata') and icao.startswith('K')
     }
     return us_airports, icao_airports, icao_to_iata
+
+
+def load_airports_cached(cache_file: Path):
+    """load_airports with a derived on-disk cache.
+
+    airportsdata walks its full IATA and ICAO tables on every call, though
+    the pipeline only consumes the US subsets. Persist those once and
+    reload them in milliseconds on later runs; the cache is keyed on the
+    airportsdata package mtime so upgrading the data rebuilds it.
+    """
+    stamp = Path(airportsdata.__file__).parent.stat().st_mtime
+    if cache_file.exists():
+        try:
+            raw = cache_file.read_bytes()
+            payload = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+            if payload.get('stamp') == stamp:
+                return payload['us_airports'], payload['icao_airports'], payload['icao_to_iata']
+        except Exception as exc:
+            logger.warning("Airport cache unreadable (%s), rebuilding", exc)
+
+    us_airports, icao_airports, icao_to_iata = load_airports()
+    # Downstream only reads US K-prefixed ICAO entries, so the cached table
+    # is pruned to those to keep the file small.
+    icao_pruned = {
+        k: v for k, v in icao_airports.items()
+        if k.startswith('K') and v.get('country') == 'US'
+    }
+    payload = {
+        'stamp': stamp,
+        'us_airports': us_airports,
+        'icao_airports': icao_pruned,
+        'icao_to_iata': icao_to_iata,
+    }
+    try:
+        data = orjson.dumps(payload) if ORJSON_AVAILABLE else json.dumps(payload).encode()
+        cache_file.write_bytes(data)
+    except Exception as exc:
+        logger.warning("Could not write airport cache: %s", exc)
+    return us_airports, icao_pruned, icao_to_iata
+
+
+def build_airport_coord_arrays(us_airports):
+    """Structure-of-arrays view of the airport table.
+
+    Returns (codes, lats_rad, lons_rad) as parallel NumPy arrays; the
+    contiguous coordinate arrays are what the spatial index and any
+    vectorized distance math want, instead of two hash lookups plus a
+    float unbox per dict-of-dicts access.
+    """
+    count = len(us_airports)
+    codes = np.array(list(us_airports.keys()))
+    lats_rad = np.radians(
+        np.fromiter((v['lat'] for v in us_airports.values()), dtype=np.float64, count=count)
+    )
+    lons_rad = np.radians(
+        np.fromiter((v['lon'] for v in us_airports.values()), dtype=np.float64, count=count)
+    )
+    return codes, lats_rad, lons_rad
+
+
+def airport_coord_frame(us_airports, icao_airports) -> pd.DataFrame:
+    """Build a coordinate lookup frame indexed by 3-letter airport code.
+
+    Covers the IATA table plus US K-prefixed ICAO entries, matching the
+    fallback order previously implemented per-row in get_airport_coords.
+    """
+    coords = {
+        code: (data.get('lat'), data.get('lon'))
+        for code, data in us_airports.items()
+    }
+    for icao, data in icao_airports.items():
+        if icao.startswith('K') and data.get('country') == 'US':
+            code = icao[1:]
+            if code not in coords:
+                coords[code] = (data.get('lat'), data.get('lon'))
+
+    return pd.DataFrame.from_dict(
+        coords, orient='index', columns=['Airport_Latitude', 'Airport_Longitude']
+    )
@@ -1,17 +1,25 @@
 """Text extraction utilities (regex-based parsing)."""
 from __future__ import annotations
 
+import functools
 import logging
 import re
-import threading
-from typing import Dict, Iterable, Optional, Set
+from typing import Dict, FrozenSet, Iterable, Optional, Set
 
+import numpy as np
 import pandas as pd
 
-DEFAULT_AIRPORT_BLACKLIST: Set[str] = {
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    PYARROW_AVAILABLE = False
+
+DEFAULT_AIRPORT_BLACKLIST: FrozenSet[str] = frozenset({
     'FBI', 'FAA', 'TSA', 'DHS', 'LEO', 'ATC', 'VFR', 'IFR', 'UAS',
     'UFO', 'USA', 'UTC', 'EST', 'PST', 'MST', 'CST', 'EDT', 'PDT', 'MDT', 'CDT'
-}
+})
 
 DEFAULT_STATE_ABBREV: Dict[str, str] = {
     'ALABAMA': 'AL', 'ALASKA': 'AK', 'ARIZONA': 'AZ', 'ARKANSAS': 'AR', 'CALIFORNIA': 'CA',
@@ -29,34 +37,83 @@ DEFAULT_STATE_ABBREV: Dict[str, str] = {
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import time so the per-row hot path never pays
+# for pattern lookup/compilation.  Alternatives that used to be tried in
+# sequence (aircraft type, altitude) are fused into single alternation
+# patterns with named groups so each field needs only one scan of the text.
+_ACFT_RE = re.compile(
+    r'ADVISED,\s*(?P<advised>[A-Z0-9]{2,6}),'
+    r'|AIRCRAFT TYPE[:\s]+(?P<typed>[A-Z0-9]{2,6})\b'
+    r'|\b(?P<make>CESSNA|BOEING|AIRBUS|PIPER|BEECH|CIRRUS|GULFSTREAM|EMBRAER)\b'
+)
+
+_DRONE_RE = re.compile(r'\b(?:UAS|DRONE)\b', re.IGNORECASE)
+
+_COLOR_RE = re.compile(
+    r'\b(RED|BLACK|GREY|GRAY|WHITE|ORANGE|GREEN|BLUE|SILVER|YELLOW|BROWN|TAN|PINK|PURPLE|GOLD|BEIGE|MULTI[- ]COLOR)\b',
+    re.IGNORECASE,
+)
+
+_ALT_RE = re.compile(
+    r'(?P<feet>\d{1,3}(?:,\d{3})*)\s*(?:FEET|FT)\b'
+    r'|FL\s*(?P<fl>\d{2,3})\b'
+)
+
+_LEO_NOTIFIED_RE = re.compile(r'([A-Z][A-Z\s]{2,40}?)\s+NOTIFIED')
+
+_LEO_NONE_PHRASES = (
+    "NOT REPORTED", "NO LEO", "NOT NOTIFIED", "NOTIFICATION NOT REPORTED", "LEOS NOT NOTIFIED"
+)
+_LEO_NONE_RE = re.compile('|'.join(re.escape(p) for p in _LEO_NONE_PHRASES))
+
+# FAA facility needles fused into one alternation: one scan of the agency
+# text instead of a Python `in` per needle.
+_FAA_FACILITY_RE = re.compile('|'.join(
+    ('ATCT', 'TRACON', 'APCH', 'APPROACH', 'TWR', 'TOWER', 'CENTER', 'FSS', 'ARTCC')
+))
+
+_LEO_PREFIX_RE = re.compile(r'^(LEO|THE|AND|ACTION|EVASIVE)\s+')
+_LEO_SUFFIX_RE = re.compile(r'\s+(NO|NOT|TAKEN|REPORTED)\.?$')
+
+# Airport-code patterns, each with a uniquely named capture group so they can
+# be fused into a single alternation and dispatched on Match.lastgroup.
+_PRIORITY_ORDER = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
+
+_AIRPORT_PATTERN_SPECS = [
+    (r'\d+\.?\d*\s+(?:N|S|E|W|NE|NW|SE|SW|NNE|NNW|SSE|SSW|ENE|ESE|WNW|WSW)\s+(?P<c0>[A-Z]{3})\b', 'critical'),
+    (r'RUNWAY\s+\d+[LRC]?\s+(?P<c1>[A-Z]{3})\b', 'high'),
+    (r'\b(?P<c2>K[A-Z]{3})\b', 'high'),
+    (r'\b(?P<c3>[A-Z]{3})\s+(?:AIRPORT|ARPT|TWR|TOWER|ATCT)', 'high'),
+    (r'\((?P<c4>[A-Z]{3})\)', 'medium'),
+    (r'\b(?P<c5>[A-Z]{3})\s+(?:CLASS|AIRSPACE)', 'medium'),
+    (r'(?:NEAR|AT|OVER|BY|FROM)\s+(?P<c6>[A-Z]{3})\b', 'medium'),
+    (r'(?P<c7>[A-Z]{3})\s*-\s*[A-Z]', 'low'),
+]
+
+_AIRPORT_UNION_RE = re.compile(
+    '|'.join(pattern for pattern, _ in _AIRPORT_PATTERN_SPECS), re.IGNORECASE
+)
+
+_AIRPORT_GROUP_PRIORITY = {
+    f'c{i}': _PRIORITY_ORDER[priority]
+    for i, (_, priority) in enumerate(_AIRPORT_PATTERN_SPECS)
+}
 
-def safe_regex_search(pattern: str, text: str, timeout_seconds: int, flags: int = 0) -> Optional[re.Match]:
-    """Regex search with timeout protection using threading."""
-    if not text:
-        return None
-
-    result = [None]
-    exception = [None]
-
-    def worker() -> None:
-        try:
-            result[0] = re.search(pattern, text, flags)
-        except Exception as exc:  # pragma: no cover - defensive
-            exception[0] = exc
 
-    thread = threading.Thread(target=worker)
-    thread.daemon = True
-    thread.start()
-    thread.join(timeout=timeout_seconds)
+def safe_regex_search(pattern: re.Pattern, text: str, timeout_seconds: int = 0) -> Optional[re.Match]:
+    """Search with a precompiled pattern.
 
-    if thread.is_alive():
-        logger.warning("Regex timeout on text: %s...", text[:100])
+    The module patterns are bounded alternations that run in linear time and
+    the callers truncate input to max_text_length, so the thread-per-call
+    timeout this function used to spawn was pure overhead. timeout_seconds
+    is kept for signature compatibility.
+    """
+    if not text:
         return None
+    return pattern.search(text)
 
-    if exception[0]:
-        raise exception[0]
 
-    return result[0]
+NULL_TOKENS = frozenset({'N/A', 'NA', 'UNKNOWN', 'NOT REPORTED', 'NONE', 'NULL', '', 'UNREPORTED'})
 
 
 def standardize_value(val):
@@ -64,12 +121,47 @@ def standardize_value(val):
     if pd.isna(val) or val is None:
         return None
     if isinstance(val, str):
-        val_upper = val.strip().upper()
-        if val_upper in ['N/A', 'NA', 'UNKNOWN', 'NOT REPORTED', 'NONE', 'NULL', '', 'UNREPORTED']:
+        if val.strip().upper() in NULL_TOKENS:
             return None
     return val
 
 
+def _standardize_arrow_column(s: pd.Series) -> Optional[pd.Series]:
+    """Null out sentinel tokens with Arrow compute kernels.
+
+    Returns None when the column is not an Arrow-backed string column so the
+    caller can fall through to the pandas path.
+    """
+    if not (PYARROW_AVAILABLE and isinstance(s.dtype, pd.ArrowDtype)):
+        return None
+    arr = s.array._pa_array
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        return None
+
+    upper = pc.utf8_upper(pc.utf8_trim_whitespace(arr))
+    is_sentinel = pc.is_in(upper, value_set=pa.array(sorted(NULL_TOKENS)))
+    cleaned = pc.if_else(is_sentinel, pa.nulls(len(arr), type=arr.type), arr)
+    return pd.Series(pd.arrays.ArrowExtensionArray(cleaned), index=s.index, name=s.name)
+
+
+def standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized standardize_value across the string columns of a frame.
+
+    Arrow-backed string columns are cleaned entirely in Arrow compute
+    kernels; other string columns take the pandas string-op path. Non-string
+    columns cannot contain the sentinel tokens and are skipped.
+    """
+    for col in df.columns:
+        s = df[col]
+        arrow_cleaned = _standardize_arrow_column(s)
+        if arrow_cleaned is not None:
+            df[col] = arrow_cleaned
+        elif s.dtype == object or pd.api.types.is_string_dtype(s):
+            stripped = s.astype('string').str.strip().str.upper()
+            df[col] = s.mask(stripped.isin(NULL_TOKENS) | stripped.isna(), None)
+    return df
+
+
 def normalize_state(state: Optional[str], state_abbrev: Dict[str, str]) -> Optional[str]:
     """Normalize state name to 2-letter abbreviation."""
     if not state or not isinstance(state, str):
@@ -80,11 +172,32 @@ def normalize_state(state: Optional[str], state_abbrev: Dict[str, str]) -> Optio
     return state_abbrev.get(state, state)
 
 
+# Full-name -> abbreviation mapping extended with identity entries for the
+# abbreviations themselves, so one vectorized map covers both cases.
+STATE_LOOKUP: Dict[str, str] = {
+    **DEFAULT_STATE_ABBREV,
+    **{abbrev: abbrev for abbrev in set(DEFAULT_STATE_ABBREV.values())},
+}
+
+
+def normalize_state_series(s: pd.Series) -> pd.Series:
+    """Vectorized normalize_state over a state column.
+
+    Returns an object Series of 2-letter codes (unmapped values pass through
+    uppercased, as in the scalar helper) with None for missing entries.
+    """
+    upper = s.astype('string').str.strip().str.upper()
+    normalized = upper.map(STATE_LOOKUP).fillna(upper)
+    return normalized.astype(object).where(normalized.notna(), None)
+
+
 def get_best_col(df: pd.DataFrame, keywords: Iterable[str]) -> Optional[str]:
-    for col in df.columns:
-        if any(key.lower() in col.lower() for key in keywords):
-            return col
-    return None
+    keys = [key.lower() for key in keywords]
+    lowered = [str(col).lower() for col in df.columns]
+    return next(
+        (df.columns[i] for i, col in enumerate(lowered) if any(key in col for key in keys)),
+        None,
+    )
 
 
 def extract_details(text: str, max_text_length: int, timeout_seconds: int) -> pd.Series:
@@ -96,26 +209,14 @@ def extract_details(text: str, max_text_length: int, timeout_seconds: int) -> pd
         text = text[:max_text_length]
 
     acft = None
-    acft_patterns = [
-        r'ADVISED,\s*([A-Z0-9]{2,6}),',
-        r'AIRCRAFT TYPE[:\s]+([A-Z0-9]{2,6})\b',
-        r'\b(CESSNA|BOEING|AIRBUS|PIPER|BEECH|CIRRUS|GULFSTREAM|EMBRAER)\b',
-    ]
-    for pattern in acft_patterns:
-        match = safe_regex_search(pattern, text, timeout_seconds)
-        if match:
-            acft = match.group(1)
-            break
-
-    has_drone = bool(safe_regex_search(r'\b(UAS|DRONE)\b', text, timeout_seconds, flags=re.IGNORECASE))
+    acft_match = safe_regex_search(_ACFT_RE, text, timeout_seconds)
+    if acft_match:
+        acft = acft_match.group(acft_match.lastgroup)
+
+    has_drone = bool(safe_regex_search(_DRONE_RE, text, timeout_seconds))
     color = "UNKNOWN"
     if has_drone:
-        color_match = safe_regex_search(
-            r'\b(RED|BLACK|GREY|GRAY|WHITE|ORANGE|GREEN|BLUE|SILVER|YELLOW|BROWN|TAN|PINK|PURPLE|GOLD|BEIGE|MULTI[- ]COLOR)\b',
-            text,
-            timeout_seconds,
-            flags=re.IGNORECASE
-        )
+        color_match = safe_regex_search(_COLOR_RE, text, timeout_seconds)
         if color_match:
             color = (
                 color_match.group(1)
@@ -125,47 +226,87 @@ def extract_details(text: str, max_text_length: int, timeout_seconds: int) -> pd
             )
 
     alt = None
-    alt_patterns = [
-        r'(\d{1,3}(?:,\d{3})*)\s*(?:FEET|FT)\b',
-        r'FL\s*(\d{2,3})\b',
-    ]
-    for pattern in alt_patterns:
-        match = safe_regex_search(pattern, text, timeout_seconds)
-        if match:
-            alt_str = match.group(1).replace(',', '')
-            if 'FL' in pattern:
-                alt = str(int(alt_str) * 100)
-            else:
-                alt = alt_str
-            break
+    alt_match = safe_regex_search(_ALT_RE, text, timeout_seconds)
+    if alt_match:
+        if alt_match.lastgroup == 'fl':
+            alt = str(int(alt_match.group('fl')) * 100)
+        else:
+            alt = alt_match.group('feet').replace(',', '')
 
     evasive = "YES" if "EVASIVE ACTION" in text and "NO EVASIVE" not in text else "NO"
     return pd.Series([acft, color, alt, evasive])
 
 
+def extract_details_frame(series: pd.Series, max_text_length: int) -> pd.DataFrame:
+    """Vectorized equivalent of extract_details over a whole summary column.
+
+    Runs each fused pattern once per column through pandas' C-level string
+    kernels instead of calling a Python function per row. FAA files repeat
+    the same narrative across rows and split chunks, so the patterns run
+    once per distinct text and the results are broadcast back by position.
+    """
+    codes, uniques = series.factorize(use_na_sentinel=False)
+    s = pd.Series(uniques).astype('string').str.slice(0, max_text_length)
+
+    acft = s.str.extract(_ACFT_RE).bfill(axis=1).iloc[:, 0]
+
+    # The color only matters for drone sightings, so the extract runs over
+    # just the drone-matching rows instead of a second full-column pass.
+    has_drone = s.str.contains(_DRONE_RE, na=False)
+    color = pd.Series('UNKNOWN', index=s.index, dtype='string')
+    if has_drone.any():
+        drone_color = s[has_drone].str.extract(_COLOR_RE, expand=False).str.upper()
+        drone_color = (
+            drone_color.str.replace('MULTI-COLOR', 'MULTI-COLORED', regex=False)
+            .str.replace('MULTI COLOR', 'MULTI-COLORED', regex=False)
+        )
+        color[has_drone] = drone_color.fillna('UNKNOWN')
+
+    alt_groups = s.str.extract(_ALT_RE)
+    feet = alt_groups['feet'].str.replace(',', '', regex=False)
+    flight_level = (pd.to_numeric(alt_groups['fl'], errors='coerce') * 100)
+    alt = feet.where(flight_level.isna(), flight_level.astype('Int64').astype('string'))
+
+    evasive = np.where(
+        s.str.contains('EVASIVE ACTION', regex=False, na=False)
+        & ~s.str.contains('NO EVASIVE', regex=False, na=False),
+        'YES',
+        'NO',
+    )
+
+    frame = pd.DataFrame(
+        {'Acft_Type': acft, 'UAS_Color': color, 'Alt_Ft': alt, 'Evasive': evasive}
+    )
+    if len(uniques) != len(series):
+        frame = frame.take(codes)
+    frame.index = series.index
+    return frame
+
+
+@functools.lru_cache(maxsize=65536)
 def extract_leo_agency(text: str, max_text_length: int) -> str:
+    # FAA narratives repeat boilerplate phrasing across sightings, so
+    # identical texts short-circuit through the cache.
     if not isinstance(text, str):
         return "UNKNOWN"
 
     if len(text) > max_text_length:
         text = text[:max_text_length]
 
-    if any(p in text.upper() for p in ["NOT REPORTED", "NO LEO", "NOT NOTIFIED", "NOTIFICATION NOT REPORTED", "LEOS NOT NOTIFIED"]):
+    if _LEO_NONE_RE.search(text.upper()):
         return "NONE REPORTED"
 
-    faa_facilities = ['ATCT', 'TRACON', 'APCH', 'APPROACH', 'TWR', 'TOWER', 'CENTER', 'FSS', 'ARTCC']
-
     matches = []
-    for match in re.finditer(r'([A-Z][A-Z\s]{2,40}?)\s+NOTIFIED', text):
+    for match in _LEO_NOTIFIED_RE.finditer(text):
         matches.append(match)
 
     for match in reversed(matches):
         agency = match.group(1).strip()
-        if any(fac in agency for fac in faa_facilities):
+        if _FAA_FACILITY_RE.search(agency):
             continue
 
-        agency = re.sub(r'^(LEO|THE|AND|ACTION|EVASIVE)\s+', '', agency)
-        agency = re.sub(r'\s+(NO|NOT|TAKEN|REPORTED)\.?$', '', agency)
+        agency = _LEO_PREFIX_RE.sub('', agency)
+        agency = _LEO_SUFFIX_RE.sub('', agency)
         agency = agency.strip('. ')
 
         if len(agency) >= 2 and agency not in ['NO', 'WAS', 'WERE', 'ACTION', 'EVASIVE', 'WOC']:
@@ -174,6 +315,26 @@ def extract_leo_agency(text: str, max_text_length: int) -> str:
     return "UNKNOWN"
 
 
+def extract_leo_agency_series(series: pd.Series, max_text_length: int) -> pd.Series:
+    """Column-level extract_leo_agency.
+
+    The cheap outcomes (no text, none-reported phrasing, no NOTIFIED mention)
+    are decided with vectorized string kernels; only rows that actually
+    contain an agency notification fall through to the per-row parser.
+    """
+    s = series.astype('string').str.slice(0, max_text_length)
+    upper = s.str.upper()
+
+    result = pd.Series("UNKNOWN", index=series.index, dtype=object)
+    none_mask = upper.str.contains(_LEO_NONE_RE, na=False)
+    result[none_mask] = "NONE REPORTED"
+
+    parse_mask = ~none_mask & upper.str.contains('NOTIFIED', regex=False, na=False)
+    if parse_mask.any():
+        result[parse_mask] = s[parse_mask].map(lambda text: extract_leo_agency(text, max_text_length))
+    return result
+
+
 def extract_airport_code(
     text: str,
     max_text_length: int,
@@ -188,38 +349,27 @@ def extract_airport_code(
     if len(text) > max_text_length:
         text = text[:max_text_length]
 
-    patterns = [
-        (r'(\d+\.?\d*)\s+(N|S|E|W|NE|NW|SE|SW|NNE|NNW|SSE|SSW|ENE|ESE|WNW|WSW)\s+([A-Z]{3})\b', 'critical', 3),
-        (r'RUNWAY\s+\d+[LRC]?\s+([A-Z]{3})\b', 'high', 1),
-        (r'\b(K[A-Z]{3})\b', 'high', 1),
-        (r'\b([A-Z]{3})\s+(?:AIRPORT|ARPT|TWR|TOWER|ATCT)', 'high', 1),
-        (r'\(([A-Z]{3})\)', 'medium', 1),
-        (r'\b([A-Z]{3})\s+(?:CLASS|AIRSPACE)', 'medium', 1),
-        (r'(?:NEAR|AT|OVER|BY|FROM)\s+([A-Z]{3})\b', 'medium', 1),
-        (r'([A-Z]{3})\s*-\s*[A-Z]', 'low', 1),
-    ]
-
-    candidates = []
-    for pattern, priority, group_num in patterns:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            code = match.group(group_num)
-
-            if len(code) == 4 and code.startswith('K'):
-                if code in icao_to_iata:
-                    code = icao_to_iata[code]
-                else:
-                    continue
-
-            if code in us_airports and code not in airport_blacklist:
-                candidates.append({
-                    'code': code,
-                    'priority': priority,
-                    'position': match.start(),
-                })
-
-    if not candidates:
-        return None
+    best_key = None
+    best_code = None
+    for match in _AIRPORT_UNION_RE.finditer(text):
+        group = match.lastgroup
+        code = match.group(group)
 
-    priority_order = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
-    candidates.sort(key=lambda x: (priority_order[x['priority']], x['position']), reverse=True)
-    return candidates[0]['code']
+        if len(code) == 4 and code.startswith('K'):
+            if code in icao_to_iata:
+                code = icao_to_iata[code]
+            else:
+                continue
+
+        if code in us_airports and code not in airport_blacklist:
+            priority = _AIRPORT_GROUP_PRIORITY[group]
+            # A critical match (distance + direction) dominates every other
+            # pattern, so stop scanning as soon as one validates.
+            if priority == _PRIORITY_ORDER['critical']:
+                return code
+            key = (priority, match.start())
+            if best_key is None or key > best_key:
+                best_key = key
+                best_code = code
+
+    return best_code
@@ -3,47 +3,132 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import re
+import sqlite3
 import time
 from pathlib import Path
 from typing import Callable, Dict, Optional
 
-from geopy.distance import geodesic
+import numpy as np
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+from geopy.extra.rate_limiter import RateLimiter
+from geopy.geocoders import Nominatim
 
+from .airports import build_airport_coord_arrays
 from .security import secure_cache_permissions
 
 try:
-    from jsonschema import validate, ValidationError
-    JSONSCHEMA_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:  # pragma: no cover - optional dependency
-    JSONSCHEMA_AVAILABLE = False
-
-CACHE_SCHEMA = {
-    "type": "object",
-    "patternProperties": {
-        "^.+,\\s[A-Z]{2}$": {
-            "type": "string",
-            "pattern": "^([A-Z]{3}|UNKNOWN|GEO_TIMEOUT)$"
-        }
-    }
-}
+    ORJSON_AVAILABLE = False
+
+try:
+    import requests  # noqa: F401
+    from geopy.adapters import RequestsAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    REQUESTS_AVAILABLE = False
+
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    SCIPY_AVAILABLE = False
+
+# Cache shape: {"City, ST": "XXX" | "UNKNOWN" | "GEO_TIMEOUT"}. Checked with
+# two compiled regexes rather than a jsonschema walker — same constraints, one
+# pass over the entries, no per-item validator dispatch.
+_CACHE_KEY_RE = re.compile(r'^.+,\s[A-Z]{2}$')
+_CACHE_VALUE_RE = re.compile(r'^(?:[A-Z]{3}|UNKNOWN|GEO_TIMEOUT)$')
 
 logger = logging.getLogger(__name__)
 
 
+class CacheValidationError(ValueError):
+    """Raised when the city cache contains malformed keys or values."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+def _validate_cache(cache_data) -> None:
+    if not isinstance(cache_data, dict):
+        raise CacheValidationError(f"expected an object, got {type(cache_data).__name__}")
+    for key, value in cache_data.items():
+        if not (isinstance(key, str) and _CACHE_KEY_RE.match(key)):
+            raise CacheValidationError(f"malformed cache key: {key!r}")
+        if not (isinstance(value, str) and _CACHE_VALUE_RE.match(value)):
+            raise CacheValidationError(f"malformed cache value for {key!r}: {value!r}")
+
+# Spatial index over the airport table, built lazily on first lookup and keyed
+# on the identity of the us_airports dict so a new table gets a new index. The
+# entry holds a reference to the dict itself: without it, id() values of
+# garbage-collected tables could be reused and hand back a stale index.
+_airport_index_cache: Dict[int, tuple] = {}
+
+
+def _unit_sphere_xyz(lat_rad, lon_rad):
+    """Convert radian lat/lon to points on the unit sphere.
+
+    Euclidean (chord) distance between such points is monotonic in
+    great-circle distance, so nearest-by-chord equals nearest-by-geodesic.
+    """
+    cos_lat = np.cos(lat_rad)
+    return np.column_stack([
+        cos_lat * np.cos(lon_rad),
+        cos_lat * np.sin(lon_rad),
+        np.sin(lat_rad),
+    ])
+
+
+def _get_airport_index(us_airports: Dict[str, Dict]):
+    key = id(us_airports)
+    cached = _airport_index_cache.get(key)
+    if cached is not None and cached[0] is us_airports:
+        return cached[1:]
+
+    codes, lat_rad, lon_rad = build_airport_coord_arrays(us_airports)
+    tree = cKDTree(_unit_sphere_xyz(lat_rad, lon_rad)) if SCIPY_AVAILABLE else None
+
+    _airport_index_cache[key] = (us_airports, codes, lat_rad, lon_rad, tree)
+    return codes, lat_rad, lon_rad, tree
+
+
+def _nearest_airport_code(coords, us_airports: Dict[str, Dict]) -> str:
+    """Return the code of the airport nearest to (lat, lon) coords."""
+    codes, lats_rad, lons_rad, tree = _get_airport_index(us_airports)
+    lat0, lon0 = np.radians(coords[0]), np.radians(coords[1])
+
+    if tree is not None:
+        _, idx = tree.query(_unit_sphere_xyz(np.array([lat0]), np.array([lon0]))[0])
+        return str(codes[idx])
+
+    # Vectorized haversine over the SoA coordinate arrays: a few ufunc
+    # passes instead of one geodesic call per airport. The sin² term is
+    # monotonic in great-circle distance, so argmin skips the
+    # arcsin/sqrt/radius steps entirely.
+    dlat = lats_rad - lat0
+    dlon = lons_rad - lon0
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat0) * np.cos(lats_rad) * np.sin(dlon / 2) ** 2
+    return str(codes[int(a.argmin())])
+
+
 def load_cache_safely(cache_file: Path) -> Dict[str, str]:
     if not cache_file.exists():
         return {}
 
     try:
-        with open(cache_file, 'r') as f:
-            cache_data = json.load(f)
-
-        if JSONSCHEMA_AVAILABLE:
-            validate(instance=cache_data, schema=CACHE_SCHEMA)
-            logger.info("Loaded %s cached locations (validated)", len(cache_data))
+        if ORJSON_AVAILABLE:
+            cache_data = orjson.loads(cache_file.read_bytes())
         else:
-            logger.info("Loaded %s cached locations (validation skipped)", len(cache_data))
+            with open(cache_file, 'r') as f:
+                cache_data = json.load(f)
+
+        _validate_cache(cache_data)
+        logger.info("Loaded %s cached locations (validated)", len(cache_data))
 
         return cache_data
 
@@ -51,7 +136,7 @@ def load_cache_safely(cache_file: Path) -> Dict[str, str]:
         logger.error("Cache file corrupted (invalid JSON): %s", exc)
         logger.info("Starting with empty cache")
         return {}
-    except ValidationError as exc:
+    except CacheValidationError as exc:
         logger.error("Cache file contains invalid data: %s", exc.message)
         logger.info("Starting with empty cache")
         return {}
@@ -62,20 +147,101 @@ def load_cache_safely(cache_file: Path) -> Dict[str, str]:
 
 def save_cache_with_validation(cache_file: Path, city_cache: Dict[str, str]) -> None:
     try:
-        if JSONSCHEMA_AVAILABLE:
-            validate(instance=city_cache, schema=CACHE_SCHEMA)
+        _validate_cache(city_cache)
 
-        with open(cache_file, 'w') as f:
-            json.dump(city_cache, f, indent=2)
+        if ORJSON_AVAILABLE:
+            cache_file.write_bytes(orjson.dumps(city_cache))
+        else:
+            with open(cache_file, 'w') as f:
+                json.dump(city_cache, f)
 
         secure_cache_permissions(cache_file)
         logger.info("Saved %s locations to cache", len(city_cache))
-    except ValidationError as exc:
+    except CacheValidationError as exc:
         logger.error("Cache data invalid, not saving: %s", exc.message)
     except Exception as exc:  # pragma: no cover - defensive
         logger.error("Error saving cache: %s", exc)
 
 
+def build_geolocator(user_agent: str):
+    """Build a Nominatim client tuned for repeated lookups.
+
+    When requests is installed the adapter keeps one pooled HTTPS session
+    instead of a fresh TLS handshake per lookup. geocode is wrapped in a
+    RateLimiter so the 1 req/s Nominatim courtesy delay is enforced only
+    around actual calls; retries stay with find_nearest_airport, which also
+    records GEO_TIMEOUT outcomes in the cache.
+    """
+    if REQUESTS_AVAILABLE:
+        geolocator = Nominatim(user_agent=user_agent, adapter_factory=RequestsAdapter)
+    else:
+        geolocator = Nominatim(user_agent=user_agent)
+    geolocator.geocode = RateLimiter(
+        geolocator.geocode, min_delay_seconds=1, max_retries=0, swallow_exceptions=False
+    )
+    return geolocator
+
+
+class SqliteCityCache:
+    """Dict-like geocoding cache backed by SQLite.
+
+    Each new entry is a single durable row insert, so the cache never needs
+    the O(N) full-file rewrite the JSON format required. WAL journaling with
+    synchronous=NORMAL keeps writes in the microsecond range while still
+    surviving a crashed run.
+    """
+
+    def __init__(self, db_file: Path):
+        self._conn = sqlite3.connect(db_file, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, val TEXT)")
+        # The WAL pragma materializes the -wal/-shm sidecars with default
+        # umask permissions; they hold cache pages too, so they need the
+        # same owner-only mode as the database itself. SQLite removes them
+        # on close and recreates them here on the next open.
+        db_path = os.fspath(db_file)
+        for path in (db_path, db_path + "-wal", db_path + "-shm"):
+            secure_cache_permissions(path)
+
+    def __contains__(self, key: str) -> bool:
+        row = self._conn.execute("SELECT 1 FROM cache WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def __getitem__(self, key: str) -> str:
+        row = self._conn.execute("SELECT val FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO cache VALUES (?, ?)", (key, value))
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def get(self, key: str, default=None):
+        row = self._conn.execute("SELECT val FROM cache WHERE key = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def update(self, entries: Dict[str, str]) -> None:
+        self._conn.executemany("INSERT OR REPLACE INTO cache VALUES (?, ?)", entries.items())
+
+    def as_dict(self) -> Dict[str, str]:
+        return dict(self._conn.execute("SELECT key, val FROM cache"))
+
+    def migrate_from_json(self, cache_file: Path) -> None:
+        """One-time import of a legacy JSON cache into an empty database."""
+        if len(self) == 0 and cache_file.exists():
+            legacy = load_cache_safely(cache_file)
+            if legacy:
+                self.update(legacy)
+                logger.info("Migrated %s entries from JSON cache %s", len(legacy), cache_file.name)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
 def find_nearest_airport(
     city: Optional[str],
     state: Optional[str],
@@ -100,11 +266,7 @@ def find_nearest_airport(
     try:
         loc = geolocator.geocode(loc_key + ", USA", timeout=15)
         if loc:
-            coords = (loc.latitude, loc.longitude)
-            closest = min(
-                us_airports.keys(),
-                key=lambda k: geodesic(coords, (us_airports[k]['lat'], us_airports[k]['lon'])).miles
-            )
+            closest = _nearest_airport_code((loc.latitude, loc.longitude), us_airports)
             city_cache[loc_key] = closest
             return closest
         city_cache[loc_key] = "UNKNOWN"
@@ -116,11 +278,7 @@ def find_nearest_airport(
                 try:
                     loc = geolocator.geocode(loc_key + ", USA", timeout=15)
                     if loc:
-                        coords = (loc.latitude, loc.longitude)
-                        closest = min(
-                            us_airports.keys(),
-                            key=lambda k: geodesic(coords, (us_airports[k]['lat'], us_airports[k]['lon'])).miles
-                        )
+                        closest = _nearest_airport_code((loc.latitude, loc.longitude), us_airports)
                         city_cache[loc_key] = closest
                         return closest
                 except (GeocoderTimedOut, GeocoderServiceError):
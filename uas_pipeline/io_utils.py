@@ -5,8 +5,102 @@ import logging
 from pathlib import Path
 from typing import List
 
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Intermediate (split/enriched) files use Parquet when pyarrow is present:
+# typed, zstd-compressed, and dictionary-encoded, so the repetitive code
+# columns shrink drastically and phase transitions skip CSV re-parsing.
+# Yearly masters stay CSV for downstream consumers.
+INTERMEDIATE_SUFFIX = '.parquet' if PYARROW_AVAILABLE else '.csv'
+
+
+def write_csv_fast(df: pd.DataFrame, path: Path) -> None:
+    """Write a CSV with Arrow's C++ writer, falling back to pandas."""
+    if PYARROW_AVAILABLE:
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pcsv
+            pcsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+            return
+        except Exception as exc:
+            logger.warning("Arrow CSV write failed for %s (%s), falling back", path.name, exc)
+    df.to_csv(path, index=False)
+
+
+def write_frame(df: pd.DataFrame, path: Path) -> None:
+    """Write an intermediate frame, dispatching on the path's suffix."""
+    if path.suffix == '.parquet':
+        df.to_parquet(path, engine='pyarrow', compression='zstd')
+    else:
+        write_csv_fast(df, path)
+
+
+def read_frame(path: Path) -> pd.DataFrame:
+    """Read one intermediate frame, dispatching on the path's suffix."""
+    if path.suffix == '.parquet':
+        return pd.read_parquet(path, engine='pyarrow')
+    return read_csv_fast(path)
+
+
+def read_frames(paths: List[Path]) -> pd.DataFrame:
+    """Read and concatenate intermediate frames of mixed formats."""
+    parquet = [p for p in paths if p.suffix == '.parquet']
+    csv = [p for p in paths if p.suffix != '.parquet']
+    frames = []
+    if parquet:
+        try:
+            import pyarrow.dataset as ds
+            frames.append(ds.dataset([str(p) for p in parquet], format='parquet').to_table().to_pandas())
+        except Exception as exc:
+            # Chunked writes can infer different dtypes for the same column
+            # (e.g. all-null vs string); pandas concat promotes them instead.
+            logger.warning("Arrow dataset scan failed (%s), falling back to pandas concat", exc)
+            frames.append(pd.concat([read_frame(p) for p in parquet], ignore_index=True))
+    if csv:
+        frames.append(read_csv_many(csv))
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
+
+
+def read_csv_fast(path: Path) -> pd.DataFrame:
+    """Read a CSV with Arrow's multithreaded parser, falling back to pandas.
+
+    The Arrow engine does not support on_bad_lines, so malformed files drop
+    back to the tolerant C-engine path used previously.
+    """
+    if PYARROW_AVAILABLE:
+        try:
+            return pd.read_csv(path, engine='pyarrow')
+        except Exception as exc:
+            logger.warning("Arrow CSV parse failed for %s (%s), falling back", path.name, exc)
+    return pd.read_csv(path, encoding='utf-8', on_bad_lines='warn')
+
+
+def read_csv_many(paths: List[Path]) -> pd.DataFrame:
+    """Read and concatenate many CSVs into a single frame.
+
+    Prefers a pyarrow dataset scan, which parses in parallel and
+    concatenates chunked buffers without one intermediate frame per file;
+    falls back to a pandas concat if Arrow cannot unify the schemas.
+    """
+    if PYARROW_AVAILABLE:
+        try:
+            import pyarrow.dataset as ds
+            table = ds.dataset([str(p) for p in paths], format='csv').to_table()
+            return table.to_pandas()
+        except Exception as exc:
+            logger.warning("Arrow dataset scan failed (%s), falling back to pandas concat", exc)
+    return pd.concat([read_csv_fast(p) for p in paths], ignore_index=True)
+
 
 def list_input_files(folder_path: Path) -> List[Path]:
     files = list(folder_path.glob('*.csv')) + list(folder_path.glob('*.xlsx'))
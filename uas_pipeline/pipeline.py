@@ -1,33 +1,261 @@
 """Pipeline orchestration."""
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import re
-import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
-from geopy.geocoders import Nominatim
 
-from .airports import load_airports
+from .airports import airport_coord_frame, load_airports_cached
 from .config import Config
 from .extractors import (
     DEFAULT_AIRPORT_BLACKLIST,
-    DEFAULT_STATE_ABBREV,
     extract_airport_code,
-    extract_details,
-    extract_leo_agency,
+    extract_details_frame,
+    extract_leo_agency_series,
     get_best_col,
-    normalize_state,
-    standardize_value,
+    normalize_state_series,
+    standardize_columns,
+)
+from .geocode import SqliteCityCache, build_geolocator, find_nearest_airport
+from .io_utils import (
+    INTERMEDIATE_SUFFIX,
+    PYARROW_AVAILABLE,
+    ensure_output_dirs,
+    list_input_files,
+    read_frame,
+    read_frames,
+    write_csv_fast,
+    write_frame,
 )
-from .geocode import find_nearest_airport, load_cache_safely, save_cache_with_validation
-from .io_utils import ensure_output_dirs, list_input_files
 from .logging_config import configure_logging
 from .security import SecurityError, validate_folder_path
 
+# Contiguous-US bounding box used for coordinate sanity checks.
+LON_BOUNDS = (-125, -65)
+LAT_BOUNDS = (25, 50)
+
+# Columns the enrichment phase attaches to every frame. The README documents
+# them as always present in the output, so consolidation keeps them even in
+# a year where every value came back empty.
+ENRICHMENT_COLUMNS = frozenset((
+    'Acft_Type', 'UAS_Color', 'Alt_Ft', 'Evasive', 'LEO_Agency',
+    'Assigned_Airport', 'Airport_Latitude', 'Airport_Longitude', 'Coord_Valid',
+))
+
+
+def _clean_columns(df: pd.DataFrame) -> pd.DataFrame:
+    # Name-based junk filter only: column names are constant across a file's
+    # chunks, so this decision made on the first chunk holds for the rest.
+    # All-NaN columns are dropped at consolidation instead — a column empty
+    # in the first chunk may still be populated later in the file.
+    keep = [not str(col).lower().startswith(('unnamed', 'column')) for col in df.columns]
+    return df.loc[:, keep]
+
+
+def _iter_source_chunks(file_path: Path, rows_per_split: int):
+    """Yield row chunks of a source file.
+
+    CSVs are streamed with chunksize so peak memory is one split's worth of
+    rows instead of the whole file (the Arrow engine does not support
+    chunked reads); Excel has no streaming reader in pandas, so it is loaded
+    once and sliced.
+    """
+    if file_path.suffix == '.xlsx':
+        df = pd.read_excel(file_path)
+        for start in range(0, len(df), rows_per_split):
+            yield df.iloc[start: start + rows_per_split]
+    else:
+        yield from pd.read_csv(
+            file_path, encoding='utf-8', on_bad_lines='warn', chunksize=rows_per_split
+        )
+
+
+# Read-only inputs shared by every enrichment task, populated once per worker
+# process by _init_enrich_worker so each task pickles only its file path.
+_WORKER_STATE: Dict[str, object] = {}
+
+
+def _init_enrich_worker(state: Dict[str, object]) -> None:
+    _WORKER_STATE.update(state)
+
+
+def _enrich_worker(file_path: Path) -> List[Tuple[str, str]]:
+    return _enrich_split_file(file_path, **_WORKER_STATE)
+
+
+def _apply_airport_coords(df: pd.DataFrame, airport_coords: pd.DataFrame) -> int:
+    """Attach coordinate columns and the Coord_Valid flag; returns valid count.
+
+    map against the indexed coordinate Series avoids the full-frame copy a
+    merge makes; misses (UNKNOWN/GEO_TIMEOUT) come back NaN for free.
+    """
+    df['Airport_Latitude'] = df['Assigned_Airport'].map(airport_coords['Airport_Latitude'])
+    df['Airport_Longitude'] = df['Assigned_Airport'].map(airport_coords['Airport_Longitude'])
+
+    lon = df['Airport_Longitude'].to_numpy(dtype=float)
+    lat = df['Airport_Latitude'].to_numpy(dtype=float)
+    valid_mask = (
+        (lon >= LON_BOUNDS[0]) & (lon <= LON_BOUNDS[1])
+        & (lat >= LAT_BOUNDS[0]) & (lat <= LAT_BOUNDS[1])
+        & ~np.isnan(lon) & ~np.isnan(lat)
+    )
+    df['Coord_Valid'] = valid_mask
+    return int(valid_mask.sum())
+
+
+def _pending_geocode_pairs(df: pd.DataFrame) -> List[Tuple[str, str]]:
+    """Unique (city, state) pairs whose Assigned_Airport is still NA."""
+    if 'Assigned_Airport' not in df.columns:
+        return []
+    missing_mask = df['Assigned_Airport'].isna()
+    if not missing_mask.any():
+        return []
+
+    city_c = get_best_col(df, ['city', 'location', 'town'])
+    stat_c = get_best_col(df, ['state', 'province'])
+    if not city_c or not stat_c:
+        return []
+
+    pending: List[Tuple[str, str]] = []
+    seen = set()
+    states_norm = normalize_state_series(df.loc[missing_mask, stat_c])
+    for city, state in zip(df.loc[missing_mask, city_c], states_norm):
+        if pd.isna(city) or not city or pd.isna(state) or not state:
+            continue
+        if (city, state) not in seen:
+            seen.add((city, state))
+            pending.append((str(city), str(state)))
+    return pending
+
+
+def _enrich_split_file(
+    file_path: Path,
+    output_folder: Path,
+    config: Config,
+    us_airports: Dict[str, Dict],
+    icao_to_iata: Dict[str, str],
+    airport_coords: pd.DataFrame,
+    city_cache_snapshot: Dict[str, str],
+) -> List[Tuple[str, str]]:
+    """Enrich one split chunk; returns (city, state) pairs needing geocoding.
+
+    Top-level so it can run in a worker process. Workers never touch the
+    geocoder: cache hits resolve against the snapshot and misses stay NA,
+    reported back as pending pairs for the parent to geocode through its
+    single rate-limited client and patch in afterwards.
+    """
+    logger = logging.getLogger(__name__)
+
+    out_file = output_folder / f"Enriched_{file_path.name}"
+    if out_file.exists():
+        logger.info("Skipping %s (already processed)", file_path.name)
+        # A crashed earlier run may have persisted this file before its NA
+        # airports were patched in; re-report them so this run patches it.
+        return _pending_geocode_pairs(read_frame(out_file))
+
+    logger.info("Processing: %s", file_path.name)
+    df = read_frame(file_path)
+    sum_c = get_best_col(df, ['summary', 'narrative', 'description', 'remarks', 'event'])
+    city_c = get_best_col(df, ['city', 'location', 'town'])
+    stat_c = get_best_col(df, ['state', 'province'])
+
+    if not sum_c:
+        logger.warning("  No summary column found, skipping file")
+        return []
+    if not city_c or not stat_c:
+        logger.warning("  Missing city/state columns - geocoding may fail")
+
+    # Keep the narrative in Arrow's contiguous UTF-8 buffer so the vectorized
+    # str.contains/str.extract passes below run on Arrow compute kernels
+    # instead of boxing a Python str per row.
+    if PYARROW_AVAILABLE:
+        df[sum_c] = df[sum_c].astype('string[pyarrow]')
+
+    df[['Acft_Type', 'UAS_Color', 'Alt_Ft', 'Evasive']] = extract_details_frame(
+        df[sum_c], config.max_text_length
+    )
+    df['LEO_Agency'] = extract_leo_agency_series(df[sum_c], config.max_text_length)
+
+    # The airport tables are unhashable dicts, so memoize per file on the
+    # narrative text alone; duplicate summaries skip the regex scan.
+    extract_code_cached = partial(
+        extract_airport_code,
+        max_text_length=config.max_text_length,
+        us_airports=us_airports,
+        icao_to_iata=icao_to_iata,
+        airport_blacklist=DEFAULT_AIRPORT_BLACKLIST,
+    )
+    df['Assigned_Airport'] = df[sum_c].map(
+        functools.lru_cache(maxsize=65536)(extract_code_cached)
+    )
+
+    pending: List[Tuple[str, str]] = []
+    missing_mask = df['Assigned_Airport'].isna()
+    if missing_mask.any():
+        logger.info(
+            "  Extracted %s airport codes from text, %s remaining need geocoding...",
+            (~missing_mask).sum(),
+            missing_mask.sum(),
+        )
+        if city_c and stat_c:
+            # Resolve what the cache snapshot already knows; anything else
+            # stays NA and is reported back as a pending (city, state) pair.
+            states_norm = normalize_state_series(df.loc[missing_mask, stat_c])
+            resolved = []
+            seen = set()
+            for city, state in zip(df.loc[missing_mask, city_c], states_norm):
+                if pd.isna(city) or not city or pd.isna(state) or not state:
+                    resolved.append("UNKNOWN")
+                    continue
+                hit = city_cache_snapshot.get(f"{city}, {state}")
+                resolved.append(hit)
+                if hit is None and (city, state) not in seen:
+                    seen.add((city, state))
+                    pending.append((str(city), str(state)))
+            df.loc[missing_mask, 'Assigned_Airport'] = resolved
+        else:
+            df.loc[missing_mask, 'Assigned_Airport'] = "UNKNOWN"
+    else:
+        logger.info("  Extracted all %s airport codes from text (no geocoding needed)", len(df))
+
+    valid_count = _apply_airport_coords(df, airport_coords)
+    logger.debug(
+        "  Coordinates populated for %s/%s records", df['Airport_Longitude'].notna().sum(), len(df)
+    )
+    logger.info("  Valid coordinates: %s/%s records", valid_count, len(df))
+
+    write_frame(df, out_file)
+    return pending
+
+
+def _fill_pending_geocodes(
+    out_file: Path, city_cache: SqliteCityCache, airport_coords: pd.DataFrame
+) -> None:
+    """Fill in airports the parent geocoded after this file's worker ran."""
+    df = read_frame(out_file)
+    missing_mask = df['Assigned_Airport'].isna()
+    if not missing_mask.any():
+        return
+
+    city_c = get_best_col(df, ['city', 'location', 'town'])
+    stat_c = get_best_col(df, ['state', 'province'])
+    states_norm = normalize_state_series(df.loc[missing_mask, stat_c])
+    df.loc[missing_mask, 'Assigned_Airport'] = [
+        city_cache.get(f"{city}, {state}", "UNKNOWN")
+        for city, state in zip(df.loc[missing_mask, city_c], states_norm)
+    ]
+    _apply_airport_coords(df, airport_coords)
+    write_frame(df, out_file)
+
 
 def run_pipeline(data_path: Path) -> None:
     """Run the FAA UAS pipeline using the refactored module structure."""
@@ -40,10 +268,8 @@ def run_pipeline(data_path: Path) -> None:
     split_folder = config.data_path / "Split_Chunks" / config.run_date
     output_folder = config.data_path / "Processed_Files" / config.run_date
     yearly_folder = config.data_path / "Yearly_Masters"
-    cache_file = config.data_path / "geocoding_cache.json"
-
-    lon_min, lon_max = -125, -65
-    lat_min, lat_max = 25, 50
+    cache_db = config.data_path / "geocoding_cache.db"
+    legacy_cache_file = config.data_path / "geocoding_cache.json"
 
     try:
         validate_folder_path(config.data_path)
@@ -53,10 +279,13 @@ def run_pipeline(data_path: Path) -> None:
 
     ensure_output_dirs([split_folder, output_folder, yearly_folder])
 
-    geolocator = Nominatim(user_agent="faa_uas_precision_v8")
-    city_cache: Dict[str, str] = load_cache_safely(cache_file)
+    city_cache = SqliteCityCache(cache_db)
+    city_cache.migrate_from_json(legacy_cache_file)
+    logger.info("Geocoding cache holds %s locations", len(city_cache))
 
-    us_airports, icao_airports, icao_to_iata = load_airports()
+    us_airports, icao_airports, icao_to_iata = load_airports_cached(
+        config.data_path / "airports_cache.json"
+    )
 
     if us_airports:
         sample_code = list(us_airports.keys())[0]
@@ -66,20 +295,7 @@ def run_pipeline(data_path: Path) -> None:
         logger.debug("Sample ICAO entry (%s): %s", sample_icao, icao_airports[sample_icao])
     logger.info("Loaded %s US IATA airports and %s ICAO mappings", len(us_airports), len(icao_to_iata))
 
-    def get_airport_coords(code: str, coord_type: str):
-        if not code or code in ['UNKNOWN', 'GEO_TIMEOUT']:
-            return None
-
-        if code in us_airports:
-            coords = us_airports[code]
-            return coords.get(coord_type)
-
-        k_code = f'K{code}'
-        if k_code in icao_airports and icao_airports[k_code].get('country') == 'US':
-            coords = icao_airports[k_code]
-            return coords.get(coord_type)
-
-        return None
+    airport_coords = airport_coord_frame(us_airports, icao_airports)
 
     def phase_1_split() -> None:
         all_files = list_input_files(config.data_path)
@@ -99,104 +315,119 @@ def run_pipeline(data_path: Path) -> None:
                     continue
 
                 logger.info("Loading: %s (%.1fMB)", file_path.name, file_size / 1024 / 1024)
-                df = pd.read_excel(file_path) if file_path.suffix == '.xlsx' else pd.read_csv(
-                    file_path, encoding='utf-8', on_bad_lines='warn'
-                )
-
-                df = df.dropna(axis=1, how='all')
-                df = df.loc[:, ~df.columns.str.contains('^Unnamed|^Column', case=False, na=False)]
 
-                sum_c = get_best_col(df, ['summary', 'narrative', 'description', 'remarks', 'event'])
-                logger.info("  Target Column identified as: [%s]", sum_c)
-
-                for i in range(0, len(df), config.rows_per_split):
-                    chunk = df.iloc[i: i + config.rows_per_split]
-                    chunk.to_csv(split_folder / f"{file_path.stem}_part_{i // config.rows_per_split + 1}.csv", index=False)
+                # Column cleanup is decided on the first chunk and reapplied
+                # to the rest so every shard carries the same columns.
+                kept_cols = None
+
+                # CSV serialization releases the GIL, so chunk writes overlap.
+                writer_count = 8
+                with ThreadPoolExecutor(max_workers=writer_count) as executor:
+                    futures = []
+                    for part, chunk in enumerate(_iter_source_chunks(file_path, config.rows_per_split), 1):
+                        if kept_cols is None:
+                            chunk = _clean_columns(chunk)
+                            kept_cols = chunk.columns
+                            sum_c = get_best_col(chunk, ['summary', 'narrative', 'description', 'remarks', 'event'])
+                            logger.info("  Target Column identified as: [%s]", sum_c)
+                        else:
+                            chunk = chunk.loc[:, kept_cols]
+                        futures.append(
+                            executor.submit(
+                                write_frame,
+                                chunk,
+                                split_folder / f"{file_path.stem}_part_{part}{INTERMEDIATE_SUFFIX}",
+                            )
+                        )
+                        # Bound in-flight writes: when parsing outruns the
+                        # disk, unbounded submission would queue every
+                        # pending chunk in memory, defeating the streaming
+                        # read above. Waiting on the oldest future caps peak
+                        # memory at one chunk per writer thread.
+                        if len(futures) >= writer_count:
+                            futures.pop(0).result()
+                    for future in futures:
+                        future.result()
             except Exception as exc:
                 logger.error("Error processing %s: %s", file_path.name, exc)
                 continue
 
     def phase_2_enrich() -> None:
-        split_files = sorted(list(split_folder.glob('*.csv')))
+        split_files = sorted(
+            p for p in split_folder.iterdir() if p.suffix in ('.csv', '.parquet')
+        )
         total_files = len(split_files)
+        if not split_files:
+            return
 
-        for idx, file_path in enumerate(split_files, 1):
-            out_file = output_folder / f"Enriched_{file_path.name}"
-            if out_file.exists():
-                logger.info("[%s/%s] Skipping %s (already processed)", idx, total_files, file_path.name)
-                continue
-
-            logger.info("[%s/%s] Processing: %s", idx, total_files, file_path.name)
-            df = pd.read_csv(file_path)
-            sum_c = get_best_col(df, ['summary', 'narrative', 'description', 'remarks', 'event'])
-            city_c = get_best_col(df, ['city', 'location', 'town'])
-            stat_c = get_best_col(df, ['state', 'province'])
-
-            if not sum_c:
-                logger.warning("  No summary column found, skipping file")
-                continue
-            if not city_c or not stat_c:
-                logger.warning("  Missing city/state columns - geocoding may fail")
+        worker_state = dict(
+            output_folder=output_folder,
+            config=config,
+            us_airports=us_airports,
+            icao_to_iata=icao_to_iata,
+            airport_coords=airport_coords,
+            city_cache_snapshot=city_cache.as_dict(),
+        )
 
-            df[['Acft_Type', 'UAS_Color', 'Alt_Ft', 'Evasive']] = df[sum_c].apply(
-                lambda text: extract_details(text, config.max_text_length, config.regex_timeout_seconds)
-            )
-            df['LEO_Agency'] = df[sum_c].apply(lambda text: extract_leo_agency(text, config.max_text_length))
-
-            df['Assigned_Airport'] = df[sum_c].apply(
-                lambda text: extract_airport_code(
-                    text,
-                    config.max_text_length,
-                    us_airports,
-                    icao_to_iata,
-                    DEFAULT_AIRPORT_BLACKLIST,
-                )
+        # Chunk files share no mutable state, so they enrich in parallel;
+        # geocoder misses come back as pending (city, state) pairs. The
+        # airport tables and cache snapshot travel once per worker via the
+        # initializer instead of being pickled into every task.
+        # Failures are contained per file: a corrupt chunk logs an error and
+        # contributes no pending pairs, while every other file still gets
+        # geocoded and patched below.
+        pending_by_file: List[List[Tuple[str, str]]] = []
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_enrich_worker,
+            initargs=(worker_state,),
+        ) as executor:
+            futures = [executor.submit(_enrich_worker, p) for p in split_files]
+            for idx, (file_path, future) in enumerate(zip(split_files, futures), 1):
+                try:
+                    pending_by_file.append(future.result())
+                    logger.info("[%s/%s] Finished %s", idx, total_files, file_path.name)
+                except Exception as exc:
+                    pending_by_file.append([])
+                    logger.error("Error enriching %s: %s", file_path.name, exc)
+
+        # Geocode every miss serially in the parent through one geolocator:
+        # a single RateLimiter keeps aggregate Nominatim traffic at 1 req/s
+        # regardless of worker count, and a city missed by several files is
+        # geocoded once instead of once per file. find_nearest_airport
+        # records each outcome in the cache as a durable row insert.
+        unique_pending = list(dict.fromkeys(
+            pair for pending in pending_by_file for pair in pending
+        ))
+        if not unique_pending:
+            return
+        logger.info("Geocoding %s unique uncached locations...", len(unique_pending))
+        geolocator = build_geolocator("faa_uas_precision_v8")
+        for city, state in unique_pending:
+            find_nearest_airport(
+                city,
+                state,
+                lambda s: s,  # states pre-normalized by the workers
+                city_cache,
+                geolocator,
+                us_airports,
+                config.max_retry_attempts,
+                config.retry_delay_base_seconds,
             )
 
-            missing_mask = df['Assigned_Airport'].isna()
-            if missing_mask.any():
-                logger.info(
-                    "  Extracted %s airport codes from text, geocoding %s remaining...",
-                    (~missing_mask).sum(),
-                    missing_mask.sum(),
+        # executor.map preserves input order, so pending lists line up with
+        # split_files; only files that reported misses need patching.
+        for file_path, pending in zip(split_files, pending_by_file):
+            if pending:
+                _fill_pending_geocodes(
+                    output_folder / f"Enriched_{file_path.name}", city_cache, airport_coords
                 )
-                df.loc[missing_mask, 'Assigned_Airport'] = df[missing_mask].apply(
-                    lambda r: find_nearest_airport(
-                        r.get(city_c),
-                        r.get(stat_c),
-                        lambda s: normalize_state(s, DEFAULT_STATE_ABBREV),
-                        city_cache,
-                        geolocator,
-                        us_airports,
-                        config.max_retry_attempts,
-                        config.retry_delay_base_seconds,
-                    ),
-                    axis=1,
-                )
-                save_cache_with_validation(cache_file, city_cache)
-            else:
-                logger.info("  Extracted all %s airport codes from text (no geocoding needed)", len(df))
-
-            df['Airport_Longitude'] = df['Assigned_Airport'].apply(lambda code: get_airport_coords(code, 'lon'))
-            df['Airport_Latitude'] = df['Assigned_Airport'].apply(lambda code: get_airport_coords(code, 'lat'))
-
-            coords_populated = df['Airport_Longitude'].notna().sum()
-            logger.debug("  Coordinates populated for %s/%s records", coords_populated, len(df))
-
-            valid_coords = df[
-                (df['Airport_Longitude'].notna())
-                & (df['Airport_Latitude'].notna())
-                & (df['Airport_Longitude'].between(lon_min, lon_max))
-                & (df['Airport_Latitude'].between(lat_min, lat_max))
-            ]
-            logger.info("  Valid coordinates: %s/%s records", len(valid_coords), len(df))
-
-            df.to_csv(out_file, index=False)
-            time.sleep(5)
 
     def phase_3_consolidate_by_year() -> None:
         processed_parent = config.data_path / "Processed_Files"
-        all_parts = list(processed_parent.glob("**/Enriched_*.csv"))
+        all_parts = list(processed_parent.glob("**/Enriched_*.csv")) + list(
+            processed_parent.glob("**/Enriched_*.parquet")
+        )
 
         if not all_parts:
             logger.warning("No enriched files found to consolidate")
@@ -211,28 +442,35 @@ def run_pipeline(data_path: Path) -> None:
             year_parts = [f for f in all_parts if year in f.name]
             logger.info("Consolidating %s files for %s...", len(year_parts), year)
 
-            combined = pd.concat([pd.read_csv(f) for f in year_parts], ignore_index=True)
+            combined = read_frames(year_parts)
 
-            for col in combined.columns:
-                combined[col] = combined[col].apply(standardize_value)
+            # Deferred from phase 1: with the whole year in view, dropping
+            # all-NaN source columns cannot lose late-populated data. Only
+            # source columns are candidates — the enrichment columns stay.
+            empty_source = [
+                col for col in combined.columns
+                if col not in ENRICHMENT_COLUMNS and combined[col].isna().all()
+            ]
+            combined = combined.drop(columns=empty_source)
 
-            original_count = len(combined)
-            combined = combined.drop_duplicates()
-            exact_dupes = original_count - len(combined)
+            combined = standardize_columns(combined)
 
             date_col = get_best_col(combined, ['date', 'event_date', 'sighting_date', 'occurred'])
             city_col = get_best_col(combined, ['city', 'location', 'town'])
 
+            # A subset dedup removes every row the full-frame dedup would,
+            # so a single pass suffices; hashing only the key columns also
+            # avoids walking every string cell of the frame.
+            original_count = len(combined)
             if date_col and city_col and 'Alt_Ft' in combined.columns:
-                pre_smart_count = len(combined)
                 combined = combined.drop_duplicates(subset=[date_col, city_col, 'Alt_Ft'], keep='first')
-                smart_dupes = pre_smart_count - len(combined)
-                logger.info("  Removed %s exact duplicates + %s likely duplicates", exact_dupes, smart_dupes)
+                logger.info("  Removed %s duplicate records (exact and likely)", original_count - len(combined))
             else:
-                logger.info("  Removed %s exact duplicate records", exact_dupes)
+                combined = combined.drop_duplicates()
+                logger.info("  Removed %s exact duplicate records", original_count - len(combined))
 
             output_file = yearly_folder / f"FAA_{year}.csv"
-            combined.to_csv(output_file, index=False)
+            write_csv_fast(combined, output_file)
             logger.info("  Saved %s records to %s", len(combined), output_file.name)
 
     try:
@@ -248,5 +486,5 @@ def run_pipeline(data_path: Path) -> None:
         logger.error("Pipeline failed: %s", exc, exc_info=True)
         raise
     finally:
-        save_cache_with_validation(cache_file, city_cache)
+        city_cache.close()
         logger.info("=== Processing Complete ===")
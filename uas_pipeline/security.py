@@ -1,10 +1,12 @@
 """Security utilities (path validation, permissions)."""
 from __future__ import annotations
 
+import functools
 import os
-import platform
+import re
 import stat
 from pathlib import Path
+from typing import Iterable
 import logging
 
 class SecurityError(Exception):
@@ -21,52 +23,182 @@ ALLOWED_BASE_DIRS = [
 
 logger = logging.getLogger(__name__)
 
-def validate_folder_path(folder_path: Path) -> None:
-    resolved_path = Path(folder_path).resolve()
-    for allowed_base in ALLOWED_BASE_DIRS:
-        allowed_resolved = Path(allowed_base).resolve()
-        try:
-            resolved_path.relative_to(allowed_resolved)
-            logger.info("Path validation passed: %s", folder_path)
-            return
-        except ValueError:
-            continue
+# os.name is a constant attribute read; platform.system() re-derives the
+# value (historically via uname) on a per-file hot path.
+_IS_WINDOWS = (os.name == "nt")
+
+_MODE_0600 = stat.S_IRUSR | stat.S_IWUSR
+_MODE_RW_WIN = stat.S_IREAD | stat.S_IWRITE
+
+
+def _resolve_base(base: str) -> str:
+    try:
+        return os.path.realpath(base)
+    except OSError:
+        return os.path.normpath(base)
+
+
+def _dedupe_bases(resolved) -> tuple:
+    # A base nested under an already-allowed parent (the defaults put two
+    # entries under the home directory) can never change the outcome, so
+    # only the broadest parents are kept.
+    kept = []
+    for base in sorted(set(resolved), key=len):
+        if not any(base == k or base.startswith(k + os.sep) for k in kept):
+            kept.append(base)
+    return tuple(kept)
+
+
+# The allowed bases never change after import, so resolve each once here,
+# kept separator-terminated so containment is a plain prefix check.
+_ALLOWED_BASE_STRS = tuple(
+    base + os.sep
+    for base in _dedupe_bases(_resolve_base(base) for base in ALLOWED_BASE_DIRS)
+)
+
+# Bases without the separator, for the common case where the validated
+# directory IS an allowed root: one hash lookup instead of a prefix scan.
+_ALLOWED_EXACT = frozenset(base[:-1] for base in _ALLOWED_BASE_STRS)
+
+# All bases fused into one anchored alternation; the regex engine shares
+# their common prefixes, so one match replaces the per-base Python loop.
+# Candidate paths get a trailing separator so a base matches itself too.
+_ALLOWED_RE = re.compile('^(?:' + '|'.join(re.escape(base) for base in _ALLOWED_BASE_STRS) + ')')
+
+
+def _fast_resolve(folder_path) -> str:
+    """Canonicalize a path, avoiding realpath when no symlink is involved.
+
+    Absolute paths whose components are all symlink-free only need a cheap
+    string normpath; realpath with its per-component readlink walk is kept
+    for relative paths and anything containing a symlink. Works in plain
+    strings — the validation path never needs a Path object.
+
+    Inputs carrying a literal '..' component are detected by string
+    inspection up front and always take the full realpath: normpath folds
+    dot-dot segments textually, which diverges from the kernel's view when
+    the folded component is a symlink.
+    """
+    raw = os.fspath(folder_path)
+    if os.path.isabs(raw) and '..' not in raw.split(os.sep):
+        norm = os.path.normpath(raw)
+        probe = norm
+        while True:
+            if os.path.islink(probe):
+                break
+            parent = os.path.dirname(probe)
+            if parent == probe:
+                return norm
+            probe = parent
+    return os.path.realpath(raw)
+
+
+@functools.lru_cache(maxsize=64)
+def _validate_folder_path_cached(path_str: str) -> None:
+    # Successful validations memoize per path string; failures raise and
+    # are therefore never cached, so a path that becomes valid (e.g. a
+    # symlink change) is re-checked.
+    resolved = _fast_resolve(path_str)
+    if resolved in _ALLOWED_EXACT or _ALLOWED_RE.match(resolved + os.sep):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Path validation passed: %s", path_str)
+        return
     raise SecurityError(
-        f"Folder path '{folder_path}' is outside allowed directories: {ALLOWED_BASE_DIRS}"
+        f"Folder path '{path_str}' is outside allowed directories: {ALLOWED_BASE_DIRS}"
     )
 
 
+def validate_folder_path(folder_path: Path) -> None:
+    _validate_folder_path_cached(os.fspath(folder_path))
+
+
+validate_folder_path.cache_clear = _validate_folder_path_cached.cache_clear
+
+
+def validate_folder_paths(paths: Iterable[Path]) -> None:
+    """Validate several folder paths, failing on the first offender.
+
+    The expensive setup (base resolution) already happens once at import
+    and repeat paths memoize, so each extra path costs one resolve plus a
+    handful of prefix checks.
+    """
+    for path in paths:
+        validate_folder_path(path)
+
+
+# pywin32 state built once on first use: the imports, the LookupAccountName
+# RPC (slow on domain-joined machines), and the owner-only security
+# descriptor are all reused across calls. False means pywin32 is absent.
+_win32_state = None
+
+
+def _get_win32_state():
+    global _win32_state
+    if _win32_state is None:
+        try:
+            import win32security
+            import ntsecuritycon as con
+            import win32api
+
+            user_sid = win32security.LookupAccountName("", win32api.GetUserName())[0]
+            dacl = win32security.ACL()
+            dacl.AddAccessAllowedAce(win32security.ACL_REVISION, con.FILE_ALL_ACCESS, user_sid)
+            sd = win32security.SECURITY_DESCRIPTOR()
+            sd.SetSecurityDescriptorDacl(1, dacl, 0)
+            _win32_state = (win32security, sd)
+        except ImportError:
+            _win32_state = False
+    return _win32_state
+
+
+# Windows paths whose owner-only ACL has already been applied; mode bits do
+# not reflect ACLs there, so the stat guard cannot tell. On POSIX the stat
+# itself answers the question — an inode-keyed cache would go stale when a
+# deleted cache file's inode is reused by a new file.
+_perm_cache: dict = {}
+
+
 def secure_cache_permissions(file_path: Path) -> None:
-    if not file_path.exists():
+    # One fspath conversion up front; str(Path) re-runs pathlib's path
+    # formatting on every use.
+    path = os.fspath(file_path)
+    try:
+        st = os.stat(path)
+    except OSError:
         return
 
-    system = platform.system()
+    if not _IS_WINDOWS:
+        if stat.S_IMODE(st.st_mode) == _MODE_0600:
+            return
+        try:
+            os.chmod(path, _MODE_0600)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Set secure permissions (0600) on %s", path)
+        except Exception as exc:
+            logger.warning("Could not set secure permissions on %s: %s", path, exc)
+        return
+
+    if _perm_cache.get(path):
+        return
     try:
-        if system == "Windows":
-            try:
-                import win32security
-                import ntsecuritycon as con
-                import win32api
-
-                user_sid = win32security.LookupAccountName("", win32api.GetUserName())[0]
-                dacl = win32security.ACL()
-                dacl.AddAccessAllowedAce(win32security.ACL_REVISION, con.FILE_ALL_ACCESS, user_sid)
-                sd = win32security.SECURITY_DESCRIPTOR()
-                sd.SetSecurityDescriptorDacl(1, dacl, 0)
-                win32security.SetFileSecurity(
-                    str(file_path),
-                    win32security.DACL_SECURITY_INFORMATION,
-                    sd
-                )
-                logger.debug("Set secure permissions (Windows ACL) on %s", file_path)
-            except ImportError:
-                logger.warning(
-                    "pywin32 not installed. Install with 'pip install pywin32' for proper Windows file permissions."
-                )
-                os.chmod(file_path, stat.S_IREAD | stat.S_IWRITE)
-                logger.debug("Set basic permissions on %s (limited on Windows)", file_path)
+        win32 = _get_win32_state()
+        if win32:
+            win32security, sd = win32
+            win32security.SetFileSecurity(
+                path,
+                win32security.DACL_SECURITY_INFORMATION,
+                sd
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Set secure permissions (Windows ACL) on %s", path)
+            _perm_cache[path] = True
         else:
-            os.chmod(file_path, stat.S_IRUSR | stat.S_IWUSR)
-            logger.debug("Set secure permissions (0600) on %s", file_path)
+            logger.warning(
+                "pywin32 not installed. Install with 'pip install pywin32' for proper Windows file permissions."
+            )
+            os.chmod(path, _MODE_RW_WIN)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Set basic permissions on %s (limited on Windows)", path)
+            _perm_cache[path] = True
     except Exception as exc:
-        logger.warning("Could not set secure permissions on %s: %s", file_path, exc)
+        logger.warning("Could not set secure permissions on %s: %s", path, exc)